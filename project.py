@@ -12,21 +12,48 @@ Top-level functions (testable):
 - generate_code(colors, length)
 - check_guess(secret, guess)
 - format_feedback(black, white, length)
+
+Solver helpers (codes as palette ids):
+- code_index(code)
+- score_lookup(guess_idx, secret_idx)    (numpy)
+- score_batch(secrets, guess)            (numpy)
+- score_numba(secret, guess)             (numba if installed, else plain Python)
 """
 
+import functools
 import random
 import tkinter as tk
-from PIL import Image, ImageTk, ImageDraw
+from PIL import Image, ImageTk
 from tkinter import messagebox, ttk
-from typing import List, Tuple
-
-def make_rounded_board(w, h, radius, color="#1e252b"):
-    img = Image.new("RGBA", (w, h), color)
-    mask = Image.new("L", (w, h), 0)
-    draw = ImageDraw.Draw(mask)
-    draw.rounded_rectangle((0, 0, w, h), radius, fill=255)
-    img.putalpha(mask)
-    return ImageTk.PhotoImage(img)
+from typing import List, Sequence, Tuple, TypeVar
+
+def rounded_rect(canvas, x1, y1, x2, y2, r, **kw):
+    """Draw a rounded rectangle on `canvas` as a smoothed polygon; return its item id."""
+    # straight-edge endpoints are doubled so smoothing only rounds the corners
+    points = (
+        x1 + r, y1, x1 + r, y1, x2 - r, y1, x2 - r, y1, x2, y1,
+        x2, y1 + r, x2, y1 + r, x2, y2 - r, x2, y2 - r, x2, y2,
+        x2 - r, y2, x2 - r, y2, x1 + r, y2, x1 + r, y2, x1, y2,
+        x1, y2 - r, x1, y2 - r, x1, y1 + r, x1, y1 + r, x1, y1,
+    )
+    return canvas.create_polygon(points, smooth=True, **kw)
+
+# the logo is decoded once; the header logo and the window icon are both built from it
+LOGO_SIZE = (40, 40)
+
+def _load_logo():
+    # decode up front instead of lazily inside the resize
+    with Image.open("mastermind.png") as im:
+        im.load()
+        return im.copy()
+
+@functools.lru_cache(maxsize=1)
+def _get_logo_images():
+    """Return (header logo, window icon) PhotoImages; needs a Tk root to exist."""
+    raw = _load_logo()
+    logo = ImageTk.PhotoImage(raw.resize(LOGO_SIZE, Image.Resampling.LANCZOS))
+    icon = ImageTk.PhotoImage(raw)
+    return logo, icon
 
 # constants & appearance
 # use hex colors for consistent Tk behavior on macOS/Linux/Windows
@@ -40,6 +67,13 @@ DISPLAY_NAMES = {
     "#b277ff": "Violet",
 }
 
+# the GUI tracks colors as small integer ids (index into COLORS) and
+# only maps them back to hex when drawing
+PALETTE_IDS = list(range(len(COLORS)))
+ID_TO_HEX = COLORS
+# plain int palette size; numba can freeze an int global but not the COLORS list
+_N_COLORS = len(COLORS)
+
 CODE_LENGTH = 4
 MAX_TRIES = 10
 
@@ -50,6 +84,7 @@ BORDER_RADIUS = 24
 HEADER_WIDTH = 400
 HEADER_HEIGHT = 60
 PALETTE_HEIGHT = 110
+PALETTE_TOP = BOARD_HEIGHT + 4
 
 # game peg visual sizes (pixels)
 LARGE_PEG_DIAM = 40
@@ -61,14 +96,44 @@ FEEDBACK_BLOCK_SIZE = LARGE_PEG_DIAM
 SMALL_PEG_DIAM = (FEEDBACK_BLOCK_SIZE - 8) // 2
 SMALL_PEG_GAP = 6
 
+# per-row geometry, identical for every row
+GUESS_W = LARGE_PEG_DIAM * CODE_LENGTH + LARGE_PEG_GAP * (CODE_LENGTH - 1) + 8
+GUESS_H = LARGE_PEG_DIAM + 8
+SMALL_XY0 = (FEEDBACK_BLOCK_SIZE - (2 * SMALL_PEG_DIAM + SMALL_PEG_GAP)) // 2
+PEG_COORDS = [
+    (4 + i * (LARGE_PEG_DIAM + LARGE_PEG_GAP), 4,
+     4 + i * (LARGE_PEG_DIAM + LARGE_PEG_GAP) + LARGE_PEG_DIAM, 4 + LARGE_PEG_DIAM)
+    for i in range(CODE_LENGTH)
+]
+FB_COORDS = [
+    (SMALL_XY0 + cc * (SMALL_PEG_DIAM + SMALL_PEG_GAP),
+     SMALL_XY0 + rr * (SMALL_PEG_DIAM + SMALL_PEG_GAP),
+     SMALL_XY0 + cc * (SMALL_PEG_DIAM + SMALL_PEG_GAP) + SMALL_PEG_DIAM,
+     SMALL_XY0 + rr * (SMALL_PEG_DIAM + SMALL_PEG_GAP) + SMALL_PEG_DIAM)
+    for rr in range(2) for cc in range(2)
+]
+
+# placement of the rows on the board canvas (row 0 is drawn at the bottom)
+BOARD_PAD = 24
+ROW_H = GUESS_H + 2 * ROW_PAD_Y
+ROW_X0 = (BOARD_WIDTH - (GUESS_W + 12 + FEEDBACK_BLOCK_SIZE)) // 2
+FB_X0 = ROW_X0 + GUESS_W + 12
+FB_Y_OFFSET = (GUESS_H - FEEDBACK_BLOCK_SIZE) // 2
+
+# feedback peg display colors, keyed by mastermind rule term
+FB_COLOR = {"black": "#39ff14", "white": "#f8ff00", "empty": "#ff5555"}
+
 
 # core logic
-def generate_code(colors: List[str] = COLORS, length: int = CODE_LENGTH) -> List[str]:
+T = TypeVar("T")
+
+
+def generate_code(colors: Sequence[T] = COLORS, length: int = CODE_LENGTH) -> List[T]:
     """Return a random secret code (list of colors). Duplicates allowed."""
-    return [random.choice(colors) for _ in range(length)]
+    return random.choices(colors, k=length)
 
 
-def check_guess(secret: List[str], guess: List[str]) -> Tuple[int, int]:
+def check_guess(secret: Sequence[T], guess: Sequence[T]) -> Tuple[int, int]:
     """
     Return (black, white):
     - black: correct color & position
@@ -76,30 +141,147 @@ def check_guess(secret: List[str], guess: List[str]) -> Tuple[int, int]:
     """
     if len(secret) != len(guess):
         raise ValueError("Secret and guess must be same length")
-    black = sum(s == g for s, g in zip(secret, guess))
-    total_matches = sum(min(secret.count(c), guess.count(c)) for c in set(guess))
-    white = total_matches - black
+    black = 0
+    # tally colors only at non-matching positions; whites are their overlap
+    s_left = {}
+    g_left = {}
+    for s, g in zip(secret, guess):
+        if s == g:
+            black += 1
+        else:
+            s_left[s] = s_left.get(s, 0) + 1
+            g_left[g] = g_left.get(g, 0) + 1
+    white = sum(min(n, g_left.get(c, 0)) for c, n in s_left.items())
     return black, white
 
 
+def _check_ids(secret, guess) -> Tuple[int, int]:
+    """
+    check_guess for codes of palette ids, tallied in fixed-size buckets.
+    Written with indexed loops only so numba can compile it (see score_numba).
+    """
+    black = 0
+    sc = [0] * _N_COLORS
+    gc = [0] * _N_COLORS
+    for i in range(len(secret)):
+        if secret[i] == guess[i]:
+            black += 1
+        sc[secret[i]] += 1
+        gc[guess[i]] += 1
+    total = 0
+    for k in range(_N_COLORS):
+        total += min(sc[k], gc[k])
+    return black, total - black
+
+
 def format_feedback(black: int, white: int, length: int = CODE_LENGTH) -> List[str]:
     """
     Return a list of length `length` with 'black' first, then 'white', then 'empty'.
     """
     if black < 0 or white < 0 or black + white > length:
         raise ValueError("Invalid black/white counts")
-    return ["black"] * black + ["white"] * white + ["empty"] * (length - black - white)
+    return _format_feedback_fast(black, white, length)
+
+
+def _format_feedback_fast(black: int, white: int, length: int = CODE_LENGTH) -> List[str]:
+    """Unvalidated format_feedback for counts that came straight from check_guess."""
+    out = ["empty"] * length
+    for i in range(black):
+        out[i] = "black"
+    for i in range(black, black + white):
+        out[i] = "white"
+    return out
+
+
+# solver helpers (numpy is only imported when the score table is first needed)
+# a code of CODE_LENGTH palette ids is indexed by its base-_N_COLORS value
+
+
+def code_index(code: List[int]) -> int:
+    """Return the table index of a code given as palette ids."""
+    idx = 0
+    for c in code:
+        idx = idx * _N_COLORS + c
+    return idx
+
+
+@functools.lru_cache(maxsize=1)
+def _build_score_table():
+    """Return a uint8 array T[guess_idx, secret_idx] = (black << 4) | white."""
+    import numpy as np
+
+    k = _N_COLORS
+    n = k ** CODE_LENGTH
+    # palette ids of every code, most significant position first
+    codes = (np.arange(n)[:, None] // k ** np.arange(CODE_LENGTH - 1, -1, -1)) % k
+    table = np.empty((n, n), dtype=np.uint8)
+    for g in range(n):
+        black, white = score_batch(codes, codes[g])
+        table[g] = (black << 4) | white
+    return table
+
+
+def score_batch(secrets, guess):
+    """
+    Score one guess against many secrets at once.
+    `secrets` is an (N, CODE_LENGTH) array of palette ids and `guess` a
+    (CODE_LENGTH,) array; returns (black, white) as two (N,) int8 arrays.
+    """
+    import numpy as np
+
+    k = _N_COLORS
+    secrets = np.asarray(secrets, dtype=np.int8)
+    guess = np.asarray(guess, dtype=np.int8)
+    black = (secrets == guess).sum(axis=1, dtype=np.int8)
+    sec_hist = np.eye(k, dtype=np.int8)[secrets].sum(axis=1, dtype=np.int8)
+    gss_hist = np.bincount(guess, minlength=k).astype(np.int8)
+    total = np.minimum(sec_hist, gss_hist).sum(axis=1, dtype=np.int8)
+    return black, total - black
+
+
+def score_lookup(guess_idx: int, secret_idx: int) -> Tuple[int, int]:
+    """Return (black, white) for two code indices from the precomputed table."""
+    v = int(_build_score_table()[guess_idx, secret_idx])
+    return v >> 4, v & 0xF
+
+
+@functools.lru_cache(maxsize=1)
+def _numba_kernel():
+    try:
+        from numba import njit
+    except ImportError:
+        return _check_ids
+    return njit(cache=True)(_check_ids)
+
+
+def score_numba(secret, guess) -> Tuple[int, int]:
+    """
+    Return (black, white) for two codes of palette ids (int arrays) using a
+    numba-compiled kernel; runs as plain Python when numba is not installed.
+    """
+    if len(secret) != len(guess):
+        raise ValueError("Secret and guess must be same length")
+    return _numba_kernel()(secret, guess)
 
 
 # GUI
+class _RowState:
+    """Canvas items and guess progress for one board row."""
+    __slots__ = ("peg_items", "guess_state", "fb_items", "solved")
+
+    def __init__(self, peg_items: List[int], fb_items: List[int]):
+        self.peg_items = peg_items
+        self.guess_state = [None] * CODE_LENGTH
+        self.fb_items = fb_items
+        self.solved = False
+
+
 class MastermindGUI:
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("Mastermind")
-        self.logo_img = ImageTk.PhotoImage(
-            Image.open("mastermind.png").resize((40, 40), Image.LANCZOS)
-        )
-        self.secret = generate_code()
+        self.logo_img, _ = _get_logo_images()
+        self.secret = generate_code(PALETTE_IDS)
         self.current_try = 0
         self.rows = []
         self.game_over = False
@@ -115,74 +297,80 @@ class MastermindGUI:
         self.container = tk.Frame(self.root, padx=pad, pady=pad)
         self.container.pack()
 
-        header = ttk.Frame(self.container)
+        # header: logo, title, help button and logo laid out left to right on one canvas
+        header = tk.Canvas(
+            self.container,
+            width=HEADER_WIDTH,
+            height=HEADER_HEIGHT,
+            bg=self.container.cget("bg"),
+            highlightthickness=0,
+            bd=0,
+        )
         header.grid(row=0, column=0, columnspan=3, pady=(4, 4))
 
-        ttk.Label(header, image=self.logo_img).pack(side="left", padx=6)
-
-        ttk.Label(
-            header,
+        cy = HEADER_HEIGHT // 2
+        logo = header.create_image(6, cy, image=self.logo_img, anchor="w")
+        title = header.create_text(
+            header.bbox(logo)[2] + 14,
+            cy,
             text="BARIS' MASTERMIND",
             font=("Helvetica", 18, "bold"),
-        ).pack(side="left", padx=8)
+            anchor="w",
+        )
 
-        ttk.Button(
+        help_button = ttk.Button(
             header,
             text="?",
             style="Help.TButton",
             command=self._show_welcome_dialog,
             cursor="hand2",
-        ).pack(side="left", padx=6)
-
-        ttk.Label(header, image=self.logo_img).pack(side="left", padx=6)
+        )
+        x = header.bbox(title)[2] + 14
+        header.create_window(x, cy, window=help_button, anchor="w")
+        x += help_button.winfo_reqwidth() + 12
+        header.create_image(x, cy, image=self.logo_img, anchor="w")
+        header.config(width=x + self.logo_img.width() + 6)
 
         self.board_color = "#1e252b"
 
-        self.board_img = make_rounded_board(BOARD_WIDTH, BOARD_HEIGHT, BORDER_RADIUS, self.board_color)
-
-        self.board_label = tk.Label(self.container, image=self.board_img, bg=self.container.cget("bg"))
-        self.board_label.grid(row=1, column=0, columnspan=3, pady=(4, 0))
-
-        self.board_bg = tk.Frame(self.board_label, bg=self.board_color, padx=24, pady=24)
-        self.board_bg.place(relx=0.5, rely=0.0, anchor="n")
-
-        self.board_frame = tk.Frame(self.board_bg, bg=self.board_color)
-        self.board_frame.pack()
-
-        self.palette_img = make_rounded_board(BOARD_WIDTH, PALETTE_HEIGHT, BORDER_RADIUS, self.board_color)
-
-        self.palette_label = tk.Label(self.container, image=self.palette_img, bg=self.container.cget("bg"))
-        self.palette_label.grid(row=2, column=0, columnspan=3, pady=(4, 0))
+        # one canvas holds both rounded backgrounds, all board and palette pegs and the status text
+        self.board_canvas = tk.Canvas(
+            self.container,
+            width=BOARD_WIDTH,
+            height=PALETTE_TOP + PALETTE_HEIGHT,
+            bg=self.container.cget("bg"),
+            highlightthickness=0,
+            bd=0,
+        )
+        self.board_canvas.grid(row=1, column=0, columnspan=3, pady=(4, 0))
 
-        peg_row = tk.Frame(self.palette_label, bg=self.board_color)
-        peg_row.place(relx=0.5, rely=0.40, anchor="center")
+        rounded_rect(self.board_canvas, 0, 0, BOARD_WIDTH, BOARD_HEIGHT, BORDER_RADIUS,
+                     fill=self.board_color, outline=self.board_color)
+        rounded_rect(self.board_canvas, 0, PALETTE_TOP, BOARD_WIDTH, PALETTE_TOP + PALETTE_HEIGHT,
+                     BORDER_RADIUS, fill=self.board_color, outline=self.board_color)
 
-        # status label
-        self.status_label = tk.Label(
-            self.palette_label,
+        # status text
+        self.status_text = self.board_canvas.create_text(
+            BOARD_WIDTH // 2,
+            PALETTE_TOP + int(PALETTE_HEIGHT * 0.80),
             text="",
-            fg="white",
-            bg=self.board_color,
-            font=("Helvetica", 11, "bold")
+            fill="white",
+            font=("Helvetica", 11, "bold"),
         )
-        self.status_label.place(relx=0.5, rely=0.80, anchor="center")
-
-        for color in COLORS:
-            pc = tk.Canvas(
-                peg_row,
-                width=LARGE_PEG_DIAM,
-                height=LARGE_PEG_DIAM,
-                highlightthickness=0,
-                bd=0,
-                cursor="hand2",
-                bg=self.board_color
-            )
-            pc.pack(side="left", padx=6)
-            pc.create_oval(2, 2, LARGE_PEG_DIAM - 2, LARGE_PEG_DIAM - 2, fill=color, outline=color)
-            pc.bind("<Button-1>", lambda ev, col=color: self._palette_click(col))
-
-        self.root.bind("<h>", lambda e: self._show_welcome_dialog())
-        self.root.bind("<H>", lambda e: self._show_welcome_dialog())
+
+        # palette pegs, centred in a row at 40% of the palette height
+        slot = LARGE_PEG_DIAM + 12
+        x = (BOARD_WIDTH - slot * len(COLORS)) // 2 + 6
+        y = PALETTE_TOP + int(PALETTE_HEIGHT * 0.40) - LARGE_PEG_DIAM // 2
+        for i, color in enumerate(COLORS):
+            oid = self.board_canvas.create_oval(x + 2, y + 2, x + LARGE_PEG_DIAM - 2, y + LARGE_PEG_DIAM - 2,
+                                                fill=color, outline=color, tags=("palette",))
+            self.board_canvas.tag_bind(oid, "<Button-1>", lambda ev, i=i: self._palette_click_id(i))
+            x += slot
+        self.board_canvas.tag_bind("palette", "<Enter>", lambda ev: self.board_canvas.config(cursor="hand2"))
+        self.board_canvas.tag_bind("palette", "<Leave>", lambda ev: self.board_canvas.config(cursor=""))
+
+        self.root.bind("<KeyPress>", lambda e: self._show_welcome_dialog() if e.keysym.lower() == "h" else None)
 
     def _show_welcome_dialog(self):
         messagebox.showinfo(
@@ -201,86 +389,60 @@ class MastermindGUI:
         )
     
     def _create_rows(self):
-        """Create MAX_TRIES row canvases at startup. Only current_try row is interactive."""
+        """Draw MAX_TRIES rows of pegs on the board canvas. Only current_try row is interactive."""
+        canvas = self.board_canvas
         for r in range(MAX_TRIES):
-            frame = tk.Frame(self.board_frame, pady=ROW_PAD_Y, bg=self.board_color, bd=0, highlightthickness=0)
-            grid_row = MAX_TRIES - 1 - r
-            frame.grid(row=grid_row, column=0, sticky="ew")
-
-            guess_w = (LARGE_PEG_DIAM * CODE_LENGTH) + (LARGE_PEG_GAP * (CODE_LENGTH - 1)) + 8
-            guess_h = LARGE_PEG_DIAM + 8
-            guess_canvas = tk.Canvas(frame, width=guess_w, height=guess_h, bg=self.board_color, highlightthickness=0, bd=0)
-            guess_canvas.pack(side="left")
-
-            peg_items = []
-            x = 4
-            y = 4
-            for i in range(CODE_LENGTH):
-                oval = guess_canvas.create_oval(x, y, x + LARGE_PEG_DIAM, y + LARGE_PEG_DIAM,
-                                               fill="lightgray", outline="lightgray")
-                peg_items.append(oval)
-                x += LARGE_PEG_DIAM + LARGE_PEG_GAP
+            y_row = BOARD_PAD + (MAX_TRIES - 1 - r) * ROW_H + ROW_PAD_Y
+
+            peg_items = [
+                canvas.create_oval(x0 + ROW_X0, y0 + y_row, x1 + ROW_X0, y1 + y_row,
+                                   fill="lightgray", outline="lightgray", tags="peg")
+                for x0, y0, x1, y1 in PEG_COORDS
+            ]
 
             # feedback block: 2x2 small indicator pegs
-            fb_canvas = tk.Canvas(frame, width=FEEDBACK_BLOCK_SIZE, height=FEEDBACK_BLOCK_SIZE,
-                                  bg=self.board_color, highlightthickness=0, bd=0)
-            fb_canvas.pack(side="left", padx=(12, 0))
-
-            fb_items = []
-            small_x0 = (FEEDBACK_BLOCK_SIZE - (2 * SMALL_PEG_DIAM + SMALL_PEG_GAP)) // 2
-            small_y0 = (FEEDBACK_BLOCK_SIZE - (2 * SMALL_PEG_DIAM + SMALL_PEG_GAP)) // 2
-            for rr in range(2):
-                for cc in range(2):
-                    sx = small_x0 + cc * (SMALL_PEG_DIAM + SMALL_PEG_GAP)
-                    sy = small_y0 + rr * (SMALL_PEG_DIAM + SMALL_PEG_GAP)
-                    soval = fb_canvas.create_oval(sx, sy, sx + SMALL_PEG_DIAM, sy + SMALL_PEG_DIAM,
-                                                  fill="lightgray", outline="lightgray")
-                    fb_items.append(soval)
-
-            row_state = {
-                "guess_canvas": guess_canvas,
-                "peg_items": peg_items,
-                "guess_state": [None] * CODE_LENGTH,
-                "fb_canvas": fb_canvas,
-                "fb_items": fb_items,
-                "solved": False
-            }
-            self.rows.append(row_state)
-
-        self.board_frame.grid_columnconfigure(0, weight=1)
+            fb_y = y_row + FB_Y_OFFSET
+            fb_items = [
+                canvas.create_oval(x0 + FB_X0, y0 + fb_y, x1 + FB_X0, y1 + fb_y,
+                                   fill="lightgray", outline="lightgray", tags="peg")
+                for x0, y0, x1, y1 in FB_COORDS
+            ]
+
+            self.rows.append(_RowState(peg_items, fb_items))
 
         # update status once rows are created
         self._update_status_label()
 
     # palette click
-    def _palette_click(self, color: str):
-        """Fill the next empty peg in the current row with `color`."""
+    def _palette_click_id(self, color_id: int):
+        """Fill the next empty peg in the current row with palette color `color_id`."""
         if self.game_over:
             return
 
         row = self.rows[self.current_try]
         # find first empty peg
         try:
-            pos = row["guess_state"].index(None)
+            pos = row.guess_state.index(None)
         except ValueError:
             # Row full: ignore palette clicks
             return
 
         # set state and draw peg
-        row["guess_state"][pos] = color
-        canvas = row["guess_canvas"]
-        oval_id = row["peg_items"][pos]
-        canvas.itemconfig(oval_id, fill=color, outline=color)
-        canvas.update_idletasks()
+        row.guess_state[pos] = color_id
+        color = ID_TO_HEX[color_id]
+        oval_id = row.peg_items[pos]
+        self.board_canvas.itemconfig(oval_id, fill=color, outline=color)
 
         # if row now full -> compute feedback immediately
-        if None not in row["guess_state"]:
-            black, white = check_guess(self.secret, row["guess_state"])
-            fb = format_feedback(black, white, CODE_LENGTH)
-            self._draw_feedback(row["fb_canvas"], row["fb_items"], fb)
+        if None not in row.guess_state:
+            black, white = _check_ids(self.secret, row.guess_state)
+            fb = _format_feedback_fast(black, white, CODE_LENGTH)
+            self._draw_feedback(row.fb_items, fb)
+            # flush the completed row once so it is visible behind any dialog
+            self.root.update_idletasks()
 
             if black == CODE_LENGTH:
-                self.rows[self.current_try]["solved"] = True
+                self.rows[self.current_try].solved = True
                 self.game_over = True
                 self._reveal_win()
                 return
@@ -302,20 +464,14 @@ class MastermindGUI:
     #
     # note: names "black" and "white" are *mastermind rule terms* and remain in logic.
     # only the visual colors differ.
-    def _draw_feedback(self, fb_canvas: tk.Canvas, fb_items: List[int], feedback: List[str]):
-        for i, v in enumerate(feedback):
-            oid = fb_items[i]
-            if v == "black":
-                fb_canvas.itemconfig(oid, fill="#39ff14", outline="#39ff14")
-            elif v == "white":
-                fb_canvas.itemconfig(oid, fill="#f8ff00", outline="#f8ff00")
-            else:
-                fb_canvas.itemconfig(oid, fill="#ff5555", outline="#ff5555")
-        fb_canvas.update_idletasks()
+    def _draw_feedback(self, fb_items: List[int], feedback: List[str]):
+        for oid, v in zip(fb_items, feedback):
+            c = FB_COLOR[v]
+            self.board_canvas.itemconfig(oid, fill=c, outline=c)
 
     # win / loss dialogs
     def _reveal_win(self):
-        names = ", ".join(DISPLAY_NAMES[c] for c in self.secret)
+        names = ", ".join(DISPLAY_NAMES[ID_TO_HEX[i]] for i in self.secret)
         if messagebox.askyesno(
             "You Win Mastermind!", 
             f"YOU WIN MASTERMIND!\n\nYou cracked the code on try #{self.current_try + 1}!\n\nThe code was:\n{names}\n\nPlay again?"
@@ -323,7 +479,7 @@ class MastermindGUI:
             self._reset_game()
 
     def _reveal_loss(self):
-        names = ", ".join(DISPLAY_NAMES[c] for c in self.secret)
+        names = ", ".join(DISPLAY_NAMES[ID_TO_HEX[i]] for i in self.secret)
         if messagebox.askyesno(
             "Game Over", 
             f"GAME OVER\n\nYou used all {MAX_TRIES} tries.\n\nThe code was:\n{names}\n\nPlay again?"
@@ -332,30 +488,28 @@ class MastermindGUI:
 
     # helpers: status & reset
     def _update_status_label(self):
-        self.status_label.config(text=f"{self.current_try + 1} / {MAX_TRIES}")
+        self.board_canvas.itemconfigure(self.status_text, text=f"{self.current_try + 1} / {MAX_TRIES}")
 
     def _reset_game(self):
-        self.secret = generate_code()
+        self.secret = generate_code(PALETTE_IDS)
         self.current_try = 0
         self.game_over = False
         for row in self.rows:
-            for oid in row["peg_items"]:
-                row["guess_canvas"].itemconfig(oid, fill="lightgray", outline="lightgray")
-            row["guess_state"] = [None] * CODE_LENGTH
-            for oid in row["fb_items"]:
-                row["fb_canvas"].itemconfig(oid, fill="lightgray", outline="lightgray")
-            row["solved"] = False
+            row.guess_state = [None] * CODE_LENGTH
+            row.solved = False
+        # every board peg carries the "peg" tag, so one call clears them all
+        self.board_canvas.itemconfigure("peg", fill="lightgray", outline="lightgray")
         self._update_status_label()
 
     # helper to reveal secret without dialog (for debugging)
     def reveal_secret_quiet(self):
-        return [DISPLAY_NAMES[c] for c in self.secret]
+        return [DISPLAY_NAMES[ID_TO_HEX[i]] for i in self.secret]
 
 # entrypoint
 def main():
     root = tk.Tk()
     try:
-        icon = tk.PhotoImage(file="mastermind.png")
+        _, icon = _get_logo_images()
         root.iconphoto(True, icon)
     except:
         pass
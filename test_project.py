@@ -1,4 +1,13 @@
-from project import generate_code, check_guess, format_feedback, COLORS, CODE_LENGTH
+import itertools
+
+import numpy as np
+import pytest
+
+from project import (
+    generate_code, check_guess, format_feedback, _check_ids,
+    code_index, score_lookup, score_batch, score_numba,
+    COLORS, CODE_LENGTH,
+)
 
 def test_generate_code_length():
     code = generate_code()
@@ -26,3 +35,51 @@ def test_check_guess_mixed():
 def test_format_feedback():
     fb = format_feedback(2, 1, length=4)
     assert fb == ["black", "black", "white", "empty"]
+
+def test_check_guess_duplicates():
+    secret = ["A", "A", "B", "B"]
+    guess =  ["A", "B", "A", "A"]
+    black, white = check_guess(secret, guess)
+    assert black == 1
+    assert white == 2
+
+def test_code_index_digit_order():
+    assert code_index([0, 0, 0, 1]) == 1
+    assert code_index([1, 0, 0, 0]) == len(COLORS) ** (CODE_LENGTH - 1)
+
+def test_score_lookup_matches_check_guess():
+    secret = [0, 0, 1, 2]
+    guess =  [0, 1, 0, 0]
+    black, white = score_lookup(code_index(guess), code_index(secret))
+    assert (black, white) == check_guess(secret, guess)
+    assert (black, white) == (1, 2)
+
+def test_score_lookup_slice():
+    codes = list(itertools.product(range(len(COLORS)), repeat=CODE_LENGTH))[::37]
+    for guess in codes:
+        for secret in codes:
+            assert score_lookup(code_index(guess), code_index(secret)) == check_guess(secret, guess)
+
+def test_score_batch():
+    secrets = [[0, 1, 2, 3], [3, 2, 1, 0], [4, 4, 4, 4]]
+    guess = [0, 1, 3, 2]
+    black, white = score_batch(secrets, guess)
+    assert list(black) == [2, 0, 0]
+    assert list(white) == [2, 4, 0]
+
+def test_score_numba():
+    secret = np.array([0, 0, 1, 2], dtype=np.int8)
+    guess = np.array([0, 1, 0, 0], dtype=np.int8)
+    assert score_numba(secret, guess) == (1, 2)
+
+def test_score_numba_length_mismatch():
+    with pytest.raises(ValueError):
+        score_numba([0, 1], [0, 1, 2, 3])
+    with pytest.raises(ValueError):
+        score_numba([0, 1, 2, 3], [0, 1])
+
+def test_check_ids_matches_check_guess():
+    secret = [0, 0, 1, 1]
+    guess =  [0, 1, 0, 0]
+    assert _check_ids(secret, guess) == check_guess(secret, guess)
+    assert _check_ids(secret, guess) == (1, 2)